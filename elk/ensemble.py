@@ -6,20 +6,58 @@ from astropy.table import Table
 from astropy.io import fits
 import astropy.units as u
 
+try:
+    import fitsio
+except ImportError:
+    fitsio = None
+
+try:
+    from joblib import Parallel, delayed
+except ImportError:
+    Parallel = None
+
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+
 import os.path
-import gc
+from concurrent.futures import ThreadPoolExecutor
 
 from .lightcurve import BasicLightcurve, TESSCutLightcurve
 from .utils import print_warning, print_failure, print_success
 
-__all__ = ["EnsembleLC", "from_fits"]
+__all__ = ["EnsembleLC", "from_fits", "process_clusters"]
+
+
+if njit is not None:
+    @njit(cache=True, parallel=True, fastmath=True)
+    def _plane_coefficients(frames, XX, YY, AtA_inv):    # pragma: no cover
+        """Fit a plane to every frame at once given the inverse of the normal matrix - each frame only
+        needs the three sums (sum x*d, sum y*d, sum d) so the whole fit fuses into one pass per frame"""
+        n_frames, n_pixels = frames.shape
+        coefficients = np.empty((n_frames, 3))
+        for i in prange(n_frames):
+            sum_xd = 0.0
+            sum_yd = 0.0
+            sum_d = 0.0
+            for j in range(n_pixels):
+                d = frames[i, j]
+                sum_xd += XX[j] * d
+                sum_yd += YY[j] * d
+                sum_d += d
+            for row in range(3):
+                coefficients[i, row] = (AtA_inv[row, 0] * sum_xd + AtA_inv[row, 1] * sum_yd
+                                        + AtA_inv[row, 2] * sum_d)
+        return coefficients
 
 
 class EnsembleLC:
     def __init__(self, radius, cluster_age=None, output_path="./", identifier=None, location=None,
                  percentile=80, cutout_size=99, scattered_light_frequency=5, n_pca=6, spline_knots=5,
                  verbose=False, just_one_lc=False, minimize_memory=False, ignore_previous_downloads=False,
-                 ignore_scattered_light=False, auto_confirm=False):
+                 ignore_scattered_light=False, auto_confirm=False, auto_create_dirs=False,
+                 n_download_workers=1):
         """Class for generating light curves from TESS cutouts
 
         Parameters
@@ -63,6 +101,14 @@ class EnsembleLC:
             Whether to ignore the scattered light test, by default False
         auto_confirm : `bool`, optional
             Whether to automatically confirm any message that you'd usually ask the user, by default False
+        auto_create_dirs : `bool`, optional
+            Whether to silently create any missing output folders without prompting or checking whether
+            they already exist (useful when constructing many classes in a batch pipeline), by default False
+        n_download_workers : `int`, optional
+            Number of threads to use for downloading sectors concurrently (downloads are network-bound so
+            several can be in flight at once). Ignored when `minimize_memory=True` since that mode deletes
+            cached downloads between sectors, and when `just_one_lc=True` since most eager downloads
+            would then be wasted. By default 1 (serial downloads)
         """
 
         # make sure that some sort of identifier has been provided
@@ -81,7 +127,7 @@ class EnsembleLC:
             else:
                 cluster_age = np.log10(cluster_age.to(u.yr).value)
 
-        self.lcs = []
+        self.lcs = {}
         self.output_path = output_path
         self.radius = radius
         self.cluster_age = cluster_age
@@ -96,6 +142,7 @@ class EnsembleLC:
         self.just_one_lc = just_one_lc
         self.minimize_memory = minimize_memory
         self.ignore_scattered_light = ignore_scattered_light
+        self.n_download_workers = n_download_workers
 
         # document how many observations failed each one of our quality tests
         self.n_failed_download = 0
@@ -104,54 +151,70 @@ class EnsembleLC:
         self.which_sectors_good = []
         self.scattered_light_sectors = []
 
-        # check main output folder
-        if output_path is not None and not os.path.exists(output_path):
-            if auto_confirm:
-                create_it = "y"
-            else:
-                print_warning(f"There is no output folder at the path that you supplied ({output_path})")
-                create_it = input(("  Would you like me to create it for you? "
-                                   "(If not then no files will be saved) [Y/n]"))
-            if create_it == "" or create_it.lower() == "y":
-                # create the folder
-                os.mkdir(output_path)
-            else:
-                output_path = None
-
-        # if we wan't to avoid the lightkurve cache we shall need our own dummy folders to delete later
-        if minimize_memory:
-            if not os.path.exists(os.path.join(output_path, 'cache')):
-                os.mkdir(os.path.join(output_path, 'cache'))
-            if not os.path.exists(os.path.join(output_path, 'cache', self.identifier)):
-                os.mkdir(os.path.join(output_path, 'cache', self.identifier))
-                os.mkdir(os.path.join(output_path, 'cache', self.identifier, 'tesscut'))
-
-        # check subfolders
-        self.save = {"lcs": False, "figures": False}
-        if output_path is not None:
-            for subpath, key in zip(["Corrected_LCs", os.path.join("Figures", "LCs")], ["lcs", "figures"]):
-                path = os.path.join(output_path, subpath)
-                if not os.path.exists(path):
-                    if auto_confirm:
-                        create_it = "y"
+        # cache for the scattered light plane-fit basis (it only depends on the cutout size)
+        self._plane_basis = None
+
+        # create every output folder up front without any prompts or existence checks if desired
+        if auto_create_dirs and output_path is not None:
+            os.makedirs(os.path.join(output_path, "Corrected_LCs"), exist_ok=True)
+            os.makedirs(os.path.join(output_path, "Figures", "LCs"), exist_ok=True)
+            if minimize_memory:
+                os.makedirs(os.path.join(output_path, 'cache', self.identifier, 'tesscut'), exist_ok=True)
+            self.save = {"lcs": True, "figures": True}
+        else:
+            # check main output folder
+            if output_path is not None and not os.path.exists(output_path):
+                if auto_confirm:
+                    create_it = "y"
+                else:
+                    print_warning(f"There is no output folder at the path that you supplied ({output_path})")
+                    create_it = input(("  Would you like me to create it for you? "
+                                       "(If not then no files will be saved) [Y/n]"))
+                if create_it == "" or create_it.lower() == "y":
+                    # create the folder
+                    os.mkdir(output_path)
+                else:
+                    output_path = None
+
+            # if we wan't to avoid the lightkurve cache we shall need our own dummy folders to delete later
+            if minimize_memory:
+                if not os.path.exists(os.path.join(output_path, 'cache')):
+                    os.mkdir(os.path.join(output_path, 'cache'))
+                if not os.path.exists(os.path.join(output_path, 'cache', self.identifier)):
+                    os.mkdir(os.path.join(output_path, 'cache', self.identifier))
+                    os.mkdir(os.path.join(output_path, 'cache', self.identifier, 'tesscut'))
+
+            # check subfolders
+            self.save = {"lcs": False, "figures": False}
+            if output_path is not None:
+                for subpath, key in zip(["Corrected_LCs", os.path.join("Figures", "LCs")],
+                                        ["lcs", "figures"]):
+                    path = os.path.join(output_path, subpath)
+                    if not os.path.exists(path):
+                        if auto_confirm:
+                            create_it = "y"
+                        else:
+                            print_warning(f"The necessary subfolder at ({path}) does not exist")
+                            create_it = input(("  Would you like me to create it for you? "
+                                               "(If not then these files will not be saved) [Y/n]"))
+                        if create_it == "" or create_it.lower() == "y":
+                            # create the folder
+                            os.makedirs(path)
+                            self.save[key] = True
                     else:
-                        print_warning(f"The necessary subfolder at ({path}) does not exist")
-                        create_it = input(("  Would you like me to create it for you? "
-                                           "(If not then these files will not be saved) [Y/n]"))
-                    if create_it == "" or create_it.lower() == "y":
-                        # create the folder
-                        os.makedirs(path)
                         self.save[key] = True
-                else:
-                    self.save[key] = True
+
+        # cache the path to the output summary file since several methods rebuild it
+        self._lc_path = os.path.join(self.output_path, 'Corrected_LCs',
+                                     str(self.identifier) + 'output_table.fits')\
+            if self.output_path is not None else None
 
         # load in previous data if desired
         if self.output_path is not None and self.previously_downloaded() and not ignore_previous_downloads:
             if self.verbose:
                 print(("Found previously corrected data for this target, loading it! "
                        "(Set `ignore_previous_downloads=True` to ignore data)"))
-            self = from_fits(os.path.join(self.output_path, "Corrected_LCs",
-                                          self.identifier + "output_table.fits"), existing_class=self)
+            self = from_fits(self._lc_path, existing_class=self)
 
     def __repr__(self):
         return f"<{self.__class__.__name__} - {self.identifier}>"
@@ -164,8 +227,7 @@ class EnsembleLC:
         exists : `bool`
             Whether the file exists
         """
-        path = os.path.join(self.output_path, 'Corrected_LCs/', str(self.identifier) + 'output_table.fits')
-        return os.path.exists(path)
+        return self._lc_path is not None and os.path.exists(self._lc_path)
 
     def has_tess_data(self):
         """Check whether TESS has data on the cluster
@@ -195,57 +257,65 @@ class EnsembleLC:
 
     def clear_cache(self):
         """Clear the folder containing manually cached lightkurve files"""
-        for file in os.listdir(os.path.join(self.output_path, 'cache', self.identifier, 'tesscut')):
-            if file.endswith(".fits"):
-                os.remove(os.path.join(self.output_path, 'cache', self.identifier, 'tesscut', file))
+        cache_path = os.path.join(self.output_path, 'cache', self.identifier, 'tesscut')
+        with os.scandir(cache_path) as entries:
+            fits_files = [entry.path for entry in entries if entry.name.endswith(".fits")]
+        for path in fits_files:
+            os.remove(path)
 
     def scattered_light(self, quality_tpfs, full_model_Normalized):
         if self.ignore_scattered_light:
             return False
-        # regular grid covering the domain of the data
-        X, Y = np.meshgrid(np.arange(0, self.cutout_size, 1), np.arange(0, self.cutout_size, 1))
-        XX = X.flatten()
-        YY = Y.flatten()
+        # the design matrix (a regular grid covering the domain of the data) and its factorisation only
+        # depend on the cutout size, so build them once and reuse them for every sector. With numba the
+        # tiny 3x3 normal matrix is inverted outright for use inside the kernel, otherwise we keep a
+        # Cholesky factor for scipy
+        if self._plane_basis is None:
+            X, Y = np.meshgrid(np.arange(0, self.cutout_size, 1), np.arange(0, self.cutout_size, 1))
+            XX, YY = X.flatten().astype(np.float64), Y.flatten().astype(np.float64)
+            A = np.c_[XX, YY, np.ones(self.cutout_size**2)]
+            AtA = A.T @ A
+            solver = np.linalg.inv(AtA) if njit is not None else scipy.linalg.cho_factor(AtA)
+            self._plane_basis = (A, XX, YY, solver)
+        A, XX, YY, solver = self._plane_basis
 
         # Define the steps for which we test for scattered light
         time_steps = np.arange(0, len(quality_tpfs), self.scattered_light_frequency)
-        coefficients_array = np.zeros((len(time_steps), 3))
         data_flux_values = (quality_tpfs - full_model_Normalized).flux.value
 
-        for i in range(len(time_steps)):
-            data = data_flux_values[time_steps[i]]
-            # best-fit linear plane
-            A = np.c_[XX, YY, np.ones(XX.shape)]
-            C, _, _, _ = scipy.linalg.lstsq(A, data.flatten())    # coefficients
-            coefficients_array[i] = C
-
-            # Deleting defined items we don't need any more to save memory
-            del A
-            del C
-            del data
-
-        X_cos = coefficients_array[:, 0]
-        Y_cos = coefficients_array[:, 1]
-        Z_cos = coefficients_array[:, 2]
-
-        mxc = max(abs(X_cos))
-        myc = max(abs(Y_cos))
-        mzc = max(abs(Z_cos))
-
-        #Deleting defined items we don't need any more to save memory
-        del X_cos
-        del Y_cos
-        del Z_cos
-        del coefficients_array
-        gc.collect() #This is a command which will delete stray arguments to save memory
+        # the design matrix is identical for every time step so we can fit the best linear plane to
+        # every frame at once through the normal equations - far cheaper than an SVD-based lstsq and
+        # plenty accurate for a plane fit
+        frames = data_flux_values[time_steps].reshape(len(time_steps), -1)
+        if njit is not None:
+            coefficients_array = _plane_coefficients(np.ascontiguousarray(frames, dtype=np.float64),
+                                                     XX, YY, solver)
+        else:
+            coefficients_array = scipy.linalg.cho_solve(solver, A.T @ frames.T).T
+
+        mxc, myc, mzc = np.max(np.abs(coefficients_array), axis=0)
 
         return (mzc > 2.5) | ((mxc > 0.02) & (myc > 0.02))
 
     def get_lcs(self):
         """Get light curves for each of the observations of the cluster.
 
-        ``self.lcs`` contains the corrected light curves after the function completes."""
-        self.lcs = [None for _ in range(self.sectors_available)]
+        ``self.lcs`` contains the corrected light curves after the function completes, keyed by the order
+        in which good sectors were found - ``self.lcs[i]`` always corresponds to
+        ``self.which_sectors_good[i]``, however the class was populated."""
+        self.lcs = {}
+
+        # a single figure that gets cleared and re-used for every sector (creating a fresh Figure per
+        # observation is surprisingly expensive when there are many sectors)
+        fig = None
+
+        # downloads are I/O-bound so several sectors can be fetched concurrently before the (CPU-bound)
+        # correction loop - not compatible with minimize_memory, which scrubs the cache between sectors,
+        # or just_one_lc, where eagerly downloading every sector would mostly be wasted work
+        prefetched_tpfs = None
+        if self.n_download_workers > 1 and not self.minimize_memory and not self.just_one_lc:
+            with ThreadPoolExecutor(max_workers=self.n_download_workers) as executor:
+                prefetched_tpfs = list(executor.map(self.downloadable, range(self.sectors_available)))
 
         # start iterating through the observations
         for sector_ind in range(self.sectors_available):
@@ -257,7 +327,8 @@ class EnsembleLC:
                 self.clear_cache()
 
             # First is the Download Test
-            tpfs = self.downloadable(sector_ind)
+            tpfs = prefetched_tpfs[sector_ind] if prefetched_tpfs is not None\
+                else self.downloadable(sector_ind)
             if tpfs is None:
                 if self.verbose:
                     print_failure('  Failed Download')
@@ -276,7 +347,7 @@ class EnsembleLC:
                 self.n_good_obs += 1
                 self.which_sectors_good.append(tpfs.sector)
                 if not self.minimize_memory:
-                    self.lcs[sector_ind] = BasicLightcurve(fits_path=lc_path, hdu_index=1)
+                    self.lcs[len(self.lcs)] = BasicLightcurve(fits_path=lc_path, hdu_index=1)
                 else:
                     del tpfs
                 continue
@@ -336,21 +407,27 @@ class EnsembleLC:
 
                 # if the user wants to save figures
                 if self.output_path is not None and self.save["figures"]:
+                    if fig is None:
+                        fig = plt.figure()
+
                     # save a plot of the light curve to visually inspect later
-                    fig, ax = lc.plot(show=False)
+                    ax = fig.add_subplot()
+                    lc.plot(fig=fig, ax=ax, show=False)
                     ax.annotate(self.identifier, xy=(0.98, 0.98), xycoords="axes fraction",
                                 ha="right", va="top", fontsize="large")
                     path = os.path.join(self.output_path, "Figures", "LCs",
                                         f'{self.identifier}_Full_Corrected_LC_Observation_{sector_ind}.png')
-                    plt.savefig(path, format='png', bbox_inches="tight")
-                    plt.close(fig)
+                    fig.savefig(path, format='png', bbox_inches="tight")
+                    fig.clf()
 
                     # also save a plot of the pixel map to visually inspect later
-                    ax = lc.quality_tpfs.plot(frame=len(lc.quality_tpfs) // 2, aperture_mask=lc.star_mask)
+                    ax = fig.add_subplot()
+                    lc.quality_tpfs.plot(ax=ax, frame=len(lc.quality_tpfs) // 2,
+                                         aperture_mask=lc.star_mask)
                     path = os.path.join(self.output_path, "Figures", "LCs",
                                         f'{self.identifier}_flux_map_observation_{sector_ind}.png')
-                    plt.savefig(path, format='png', bbox_inches="tight")
-                    plt.close(ax.get_figure())
+                    fig.savefig(path, format='png', bbox_inches="tight")
+                    fig.clf()
 
                 # if minimizing memory usage then delete the lightcurve since it's already been saved
                 if self.minimize_memory:
@@ -358,7 +435,7 @@ class EnsembleLC:
 
                 # otherwise make it accessible to the class as a whole
                 else:
-                    self.lcs[sector_ind] = lc
+                    self.lcs[len(self.lcs)] = lc
 
                 if self.just_one_lc:
                     if self.verbose:
@@ -366,13 +443,17 @@ class EnsembleLC:
                                "`self.just_one_lc=True`"))
                     break
 
+        # close the re-used figure now that every sector has been plotted
+        if fig is not None:
+            plt.close(fig)
+
         # if minimizing memory, need to load back in the basic corrected lightcurves for the good sectors
         if self.minimize_memory:
             self.clear_cache()
-            self.lcs = [BasicLightcurve(fits_path=os.path.join(self.output_path, "Corrected_LCs",
-                                                               self.identifier + f"_lc_{sector}.fits"),
-                                        hdu_index=1)
-                        for sector in self.which_sectors_good]
+            self.lcs = {ind: BasicLightcurve(fits_path=os.path.join(self.output_path, "Corrected_LCs",
+                                                                    self.identifier + f"_lc_{sector}.fits"),
+                                             hdu_index=1)
+                        for ind, sector in enumerate(self.which_sectors_good)}
             
     def create_output_table(self):
         """Generate lightcurve output summary table for the cluster and save in `self.output_path`
@@ -381,7 +462,7 @@ class EnsembleLC:
         will also automatically run the whole pipeline.
         """
         # if data is available and the lightcurves have not yet been calculated
-        if self.lcs == [] and self.has_tess_data():
+        if len(self.lcs) == 0 and self.has_tess_data():
             # download and correct lightcurves
             self.get_lcs()
 
@@ -403,10 +484,14 @@ class EnsembleLC:
         hdr["scat_sec"] = (','.join([str(sec) for sec in self.scattered_light_sectors]),
                            "Sectors that fail the scattered light test")
         empty_primary = fits.PrimaryHDU(header=hdr)
-        hdul = fits.HDUList([empty_primary] + [lc.hdu for lc in self.lcs if lc is not None])
+        hdul = fits.HDUList([empty_primary] + [self.lcs[ind].hdu for ind in sorted(self.lcs)])
+
+        # every lightcurve is now materialized so release the summary file before (over)writing it -
+        # writing to a file we still hold open/memmapped fails outright on Windows
+        if isinstance(self.lcs, _LazyLCList):
+            self.lcs.close()
         if self.output_path is not None:
-            hdul.writeto(os.path.join(self.output_path, 'Corrected_LCs/',
-                         str(self.identifier) + 'output_table.fits'), overwrite=True)
+            hdul.writeto(self._lc_path, overwrite=True)
 
     def summary_table(self):
         """Summarize ensemble light curve in an Astropy Table
@@ -417,20 +502,113 @@ class EnsembleLC:
             The full lightcurves output table that was saved
         """
         # if there isn't a saved output file then don't print anything (well, except an error)
-        if not os.path.isfile(os.path.join(self.output_path, 'Corrected_LCs/',
-                                           str(self.identifier) + 'output_table.fits')):
+        if self._lc_path is None or not os.path.isfile(self._lc_path):
             print_failure("Ensemble light curve pipeline not yet run, no table available, run `self.get_lcs`")
             return None
 
         # return a simple summary table that can be conveniently stacked with other clusters
+        lcs = [self.lcs[ind] for ind in sorted(self.lcs)]
+
+        # every lightcurve is now materialized so the summary file doesn't need to stay open
+        if isinstance(self.lcs, _LazyLCList):
+            self.lcs.close()
         return Table({'name': [self.identifier], 'location': [self.location], 'radius': [self.radius],
                       'log_age': [self.cluster_age], 'has_data': [self.sectors_available > 0],
                       'n_obs': [self.sectors_available], 'n_good_obs': [self.n_good_obs],
-                      'which_sectors_good': [str([lc.sector if lc is not None else -99 for lc in self.lcs])],
+                      'which_sectors_good': [str([lc.sector for lc in lcs])],
                       'n_failed_download': [self.n_failed_download], 'n_bad_quality': [self.n_bad_quality],
                       'n_scatter_light': [len(self.scattered_light_sectors)],
                       'scattered_light_sectors': [str([self.scattered_light_sectors if len(self.scattered_light_sectors) > 0 else -99])],
-                      'lc_lens': [str([len(lc.corrected_lc) if lc is not None else -99 for lc in self.lcs])]})
+                      'lc_lens': [str([len(lc.corrected_lc) for lc in lcs])]})
+
+
+def process_clusters(identifiers, radii, cluster_ages=None, n_jobs=-1, **kwargs):
+    """Download, correct and save ensemble lightcurves for several clusters in parallel
+
+    Clusters are entirely independent of one another so each one is dispatched to its own process with
+    ``joblib``. Be sure to pass ``auto_confirm=True`` or ``auto_create_dirs=True`` so that workers never
+    block waiting on a prompt.
+
+    Each worker saves its cluster's corrected lightcurves and output table to disk and sends back only
+    the lightweight summary table - live :class:`EnsembleLC` instances hold open FITS handles that can't
+    cross process boundaries. Use :func:`from_fits` afterwards to (cheaply) reload any cluster in full.
+
+    Parameters
+    ----------
+    identifiers : `list` of `str`
+        Identifier for each cluster (see :class:`EnsembleLC`)
+    radii : `list` of `float`
+        Radius of each cluster
+    cluster_ages : `list` of `float`, optional
+        Age of each cluster, by default None
+    n_jobs : `int`, optional
+        Number of processes to use (-1 means one per core), by default -1
+    **kwargs : `various`
+        Keyword arguments passed directly to every :class:`EnsembleLC`
+
+    Returns
+    -------
+    summaries : `list` of :class:`~astropy.table.Table`
+        Summary table for each cluster (see :meth:`EnsembleLC.summary_table`)
+    """
+    assert Parallel is not None, "`joblib` must be installed to process clusters in parallel"
+
+    if cluster_ages is None:
+        cluster_ages = [None for _ in identifiers]
+
+    def _process_one(identifier, radius, cluster_age):
+        cluster = EnsembleLC(identifier=identifier, radius=radius, cluster_age=cluster_age, **kwargs)
+        cluster.create_output_table()
+        return cluster.summary_table()
+
+    return Parallel(n_jobs=n_jobs)(delayed(_process_one)(identifier, radius, cluster_age)
+                                   for identifier, radius, cluster_age
+                                   in zip(identifiers, radii, cluster_ages))
+
+
+class _LazyLCList:
+    """Dict-like wrapper around the lightcurve HDUs in a fits file that only constructs each
+    :class:`~elk.lightcurve.BasicLightcurve` (and so only reads its data) on first access.
+
+    Matches how ``EnsembleLC.lcs`` behaves: indexed by the position of the lightcurve and iterating
+    yields the keys rather than the lightcurves themselves."""
+    def __init__(self, fits_path, hdu_indices):
+        self.fits_path = fits_path
+        self.hdu_indices = list(hdu_indices)
+        self._cache = {}
+        self._hdul = None
+
+    def __len__(self):
+        return len(self.hdu_indices)
+
+    def __getitem__(self, ind):
+        if ind not in self._cache:
+            # keep the file open (memory-mapped) across accesses rather than re-opening per lightcurve
+            if self._hdul is None:
+                self._hdul = fits.open(self.fits_path, memmap=True)
+            self._cache[ind] = BasicLightcurve(hdu=self._hdul[self.hdu_indices[ind]])
+        return self._cache[ind]
+
+    def __iter__(self):
+        return iter(range(len(self)))
+
+    def __getstate__(self):
+        # the open file handle can't be pickled - drop it and let it re-open lazily on next access
+        state = self.__dict__.copy()
+        state["_hdul"] = None
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+
+    def close(self):
+        """Close the underlying fits file (already-loaded lightcurves remain usable)"""
+        if self._hdul is not None:
+            self._hdul.close()
+            self._hdul = None
+
+    def __del__(self):
+        self.close()
 
 
 def from_fits(filepath, existing_class=None, **kwargs):
@@ -447,23 +625,34 @@ def from_fits(filepath, existing_class=None, **kwargs):
     else:
         new_ecl = existing_class
 
-    # open up the fits file and load in the information
-    with fits.open(filepath) as hdul:
-        details = hdul[0]
-        new_ecl.identifier = details.header["name"]
-        new_ecl.location = details.header["location"]
-        new_ecl.callable = new_ecl.identifier if new_ecl.identifier is not None else new_ecl.location
-        new_ecl.radius = details.header["radius"]
-        new_ecl.cluster_age = details.header["log_age"]
-        new_ecl.sectors_available = details.header["n_obs"]
-        new_ecl.n_good_obs = details.header["n_good"]
-        new_ecl.n_failed_download = details.header["n_dlfail"]
-        new_ecl.n_bad_quality = details.header["n_qual"]
-        new_ecl.scattered_light_sectors = [] if details.header["scat_sec"] == ""\
-            else list(map(int, details.header["scat_sec"].split(',')))
-
-        new_ecl.lcs = [BasicLightcurve(fits_path=filepath, hdu_index=hdu_ind)
-                       for hdu_ind in range(1, len(hdul))]
-        new_ecl.which_sectors_good = [lc.sector for lc in new_ecl.lcs if lc is not None]
+    # open up the fits file and load in the information (fitsio reads the headers in single C calls)
+    if fitsio is not None:
+        with fitsio.FITS(filepath) as f:
+            header = f[0].read_header()
+            sectors = [f[hdu_ind].read_header()["sector"] for hdu_ind in range(1, len(f))]
+    else:
+        with fits.open(filepath, memmap=True) as hdul:
+            header = hdul[0].header
+            sectors = [hdul[hdu_ind].header["sector"] for hdu_ind in range(1, len(hdul))]
+
+    new_ecl.identifier = header["name"]
+    new_ecl.location = header["location"]
+    new_ecl.callable = new_ecl.identifier if new_ecl.identifier is not None else new_ecl.location
+    new_ecl.radius = header["radius"]
+    new_ecl.cluster_age = header["log_age"]
+    new_ecl.sectors_available = header["n_obs"]
+    new_ecl.n_good_obs = header["n_good"]
+    new_ecl.n_failed_download = header["n_dlfail"]
+    new_ecl.n_bad_quality = header["n_qual"]
+    new_ecl.scattered_light_sectors = [] if header["scat_sec"] == ""\
+        else list(map(int, header["scat_sec"].split(',')))
+
+    # defer reading the lightcurve data until each one is actually accessed - the sectors come straight
+    # from the headers so nothing needs to be materialized up front
+    new_ecl.lcs = _LazyLCList(filepath, range(1, len(sectors) + 1))
+    new_ecl.which_sectors_good = sectors
+
+    # the file we just read *is* the output summary file, so point the cached path at it
+    new_ecl._lc_path = filepath
 
     return new_ecl
@@ -7,6 +7,11 @@ import lightkurve as lk
 from tqdm import tqdm
 import matplotlib.pyplot as plt
 
+try:
+    import fitsio
+except ImportError:
+    fitsio = None
+
 import os
 import imageio
 from astroquery.simbad import Simbad
@@ -26,7 +31,7 @@ TESS_RESOLUTION = 21 * u.arcsec / u.pixel
 
 class BasicLightcurve():
     def __init__(self, time=None, flux=None, flux_err=None, sector=None, fits_path=None, hdu_index=None,
-                 periodogram_freqs=np.arange(0.04, 11, 0.01)):
+                 hdu=None, periodogram_freqs=np.arange(0.04, 11, 0.01)):
         """A basic lightcurve class for calculating statistics of corrected lightcurves and plotting them.
 
         This class can either be instantiated manually using time, flux and flux_err values, or loaded in from
@@ -46,22 +51,41 @@ class BasicLightcurve():
             Path to a fits file containing the lightcurve, by default None
         hdu_index : `int`, optional
             Index of the HDU containing the lightcurve, by default None
+        hdu : :class:`~astropy.io.fits.BinTableHDU`, optional
+            An already-loaded HDU containing the lightcurve - this avoids re-opening the file when the
+            caller already has it open, by default None
         periodogram_freqs : :class:`numpy.ndarray`, optional
             Frequencies at which to evaluate any periodograms, by default np.arange(0.04, 11, 0.01)
         """
-        # check that either data or a file has been given
+        # check that either data, an HDU, or a file has been given
         has_data = time is not None and flux is not None and flux_err is not None and sector is not None
         has_file = fits_path is not None and hdu_index is not None
-        assert has_data or has_file, "Must either provide data or a fits file and HDU index"
-
+        assert has_data or has_file or hdu is not None,\
+            "Must either provide data, an HDU, or a fits file and HDU index"
+
+        # if the user has handed us an already-open HDU then read straight from it
+        if hdu is not None:
+            self.corrected_lc = lk.LightCurve(time=hdu.data["time"] * u.day,
+                                              flux=hdu.data["flux"] * u.electron / u.s,
+                                              flux_err=hdu.data["flux_err"] * u.electron / u.s)
+            self.sector = hdu.header["sector"]
         # if the user has given us a file then load it into the class
-        if has_file:
-            with fits.open(fits_path) as hdul:
-                hdu = hdul[hdu_index]
-                self.corrected_lc = lk.LightCurve(time=hdu.data["time"] * u.day,
-                                                  flux=hdu.data["flux"] * u.electron / u.s,
-                                                  flux_err=hdu.data["flux_err"] * u.electron / u.s)
-                self.sector = hdu.header["sector"]
+        elif has_file:
+            # read just the columns we need with fitsio when available (much faster for wide tables)
+            if fitsio is not None:
+                with fitsio.FITS(fits_path) as f:
+                    data = f[hdu_index].read(columns=["time", "flux", "flux_err"])
+                    self.sector = f[hdu_index].read_header()["sector"]
+                self.corrected_lc = lk.LightCurve(time=data["time"] * u.day,
+                                                  flux=data["flux"] * u.electron / u.s,
+                                                  flux_err=data["flux_err"] * u.electron / u.s)
+            else:
+                with fits.open(fits_path, memmap=True) as hdul:
+                    file_hdu = hdul[hdu_index]
+                    self.corrected_lc = lk.LightCurve(time=file_hdu.data["time"] * u.day,
+                                                      flux=file_hdu.data["flux"] * u.electron / u.s,
+                                                      flux_err=file_hdu.data["flux_err"] * u.electron / u.s)
+                    self.sector = file_hdu.header["sector"]
         # otherwise create a lightcurve directly
         else:
             self.corrected_lc = lk.LightCurve(time=time, flux=flux, flux_err=flux_err)
@@ -646,13 +670,18 @@ class TESSCutLightcurve(BasicLightcurve):
                               self.stats["peak_right_edge"]))
         else:
             if isinstance(freq_bins, int):
-                freq_bins = np.logspace(min(self.periodogram_freqs), max(self.periodogram_freqs), freq_bins)
+                freq_bins = np.logspace(np.min(self.periodogram_freqs), np.max(self.periodogram_freqs),
+                                        freq_bins)
             bounds = list(zip(freq_bins[:-1], 0.5 *(freq_bins[:-1] + freq_bins[1:]), freq_bins[1:]))
 
+        # single-pass NumPy reductions (Python's max/min iterate element-by-element over arrays)
+        max_freq = np.max(self.periodogram_freqs)
+        max_power = np.max(self.periodogram)
+
         # create a separate frame for each frequency bin
         i = 0
         for lower, center, upper in bounds:
-            if lower > max(self.periodogram_freqs):
+            if lower > max_freq:
                 continue
             # start a three panel figure
             fig, axes = plt.subplots(1, 3, figsize=(18, 4))
@@ -727,7 +756,7 @@ class TESSCutLightcurve(BasicLightcurve):
 
             # plot the max power in each pixel in the same range as the right panel
             im = axes[1].imshow(pixel_max_power, extent=list(axes[0].get_xlim()) + list(axes[0].get_ylim()),
-                                origin='lower', cmap='Greys', vmax=max(self.periodogram))
+                                origin='lower', cmap='Greys', vmax=max_power)
 
             cbar = fig.colorbar(im, ax=axes[1])
             cbar.set_label('LS periodogram power')
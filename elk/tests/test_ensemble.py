@@ -1,7 +1,10 @@
 import numpy as np
 from elk.ensemble import EnsembleLC, from_fits
+from elk.lightcurve import BasicLightcurve
+from astropy.io import fits
 import unittest
 import os
+import pickle
 import shutil
 
 
@@ -33,4 +36,50 @@ class Test(unittest.TestCase):
 
         self.assertTrue(new_c.output_path is not None)
 
-        shutil.rmtree("ensemble_test_output")
\ No newline at end of file
+        shutil.rmtree("ensemble_test_output")
+
+    def test_lazy_lc_list(self):
+        """check that lightcurves from summary files are loaded lazily and survive pickling"""
+        os.makedirs(os.path.join("lazy_test_output", "Corrected_LCs"))
+        os.makedirs(os.path.join("lazy_test_output", "Figures", "LCs"))
+
+        # build a small synthetic summary file in the same format that `create_output_table` produces
+        t = np.linspace(50, 150, 100)
+        hdus = [fits.PrimaryHDU()]
+        for sector in [3, 7]:
+            lc = BasicLightcurve(time=t, flux=np.random.uniform(1, 2, len(t)),
+                                 flux_err=np.repeat(0.01, len(t)), sector=sector)
+            hdus.append(lc.hdu)
+        hdr = hdus[0].header
+        hdr["name"] = "Fake Cluster"
+        hdr["location"] = "0.0, 0.0"
+        hdr["radius"] = 0.1
+        hdr["log_age"] = 8.0
+        hdr["has_data"] = True
+        hdr["n_obs"] = 2
+        hdr["n_good"] = 2
+        hdr["n_dlfail"] = 0
+        hdr["n_qual"] = 0
+        hdr["n_scatt"] = 0
+        hdr["scat_sec"] = ""
+        path = os.path.join("lazy_test_output", "Corrected_LCs", "fake_summary.fits")
+        fits.HDUList(hdus).writeto(path, overwrite=True)
+
+        c = from_fits(path)
+        self.assertTrue(len(c.lcs) == 2)
+        self.assertTrue(list(c.lcs) == [0, 1])
+        self.assertTrue(c.which_sectors_good == [3, 7])
+
+        # nothing should be read from the file until a lightcurve is accessed
+        self.assertTrue(c.lcs._cache == {})
+        self.assertTrue(c.lcs[1].sector == 7)
+
+        # the class should survive a pickle round-trip even while the file is open
+        c_copy = pickle.loads(pickle.dumps(c))
+        self.assertTrue(c_copy.lcs[0].sector == 3)
+
+        # already-loaded lightcurves should remain usable after closing the file
+        c.lcs.close()
+        self.assertTrue(all(c.lcs[1].corrected_lc.time.value == t))
+
+        shutil.rmtree("lazy_test_output")
\ No newline at end of file
@@ -13,7 +13,7 @@ def random_lc(n_times=10000, n_lc=1000):
     curves = np.array([amplitudes[i] * np.sin(2 * np.pi / periods[i] * (times - phases[i]))
                        for i in range(n_lc)])
     flux = curves.sum(axis=0)
-    flux -= (min(flux) - 1)
+    flux -= (flux.min() - 1)
     return times, flux
 
 
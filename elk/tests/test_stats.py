@@ -5,19 +5,23 @@ from scipy.stats import skewnorm
 
 N_VALS = 10000
 
+
 def random_walk(start=0, steps=N_VALS, step_size=0.01, walk_prob=0.05, reset_every=None):
-    walk = np.empty(steps)
-    walk[0] = start
+    # map each uniform draw to a step in {-step_size, 0, +step_size} without any branching
     choices = np.random.rand(steps)
-    for i in range(1, steps):
-        if choices[i] > 1 - walk_prob:
-            walk[i] = walk[i - 1] + step_size
-        elif choices[i] < walk_prob:
-            walk[i] = walk[i - 1] - step_size
-        else:
-            walk[i] = walk[i - 1]
-        if reset_every is not None and i > 0 and (i % reset_every) == 0:
-            walk[i] = start
+    step_arr = (np.where(choices > 1 - walk_prob, step_size, 0.0)
+                - np.where(choices < walk_prob, step_size, 0.0))
+    step_arr[0] = start
+
+    # without resets the whole walk is just a cumulative sum of the steps
+    if reset_every is None:
+        return np.cumsum(step_arr)
+
+    # otherwise each segment restarts from `start` and accumulates independently
+    walk = np.empty(steps)
+    for seg_start in range(0, steps, reset_every):
+        step_arr[seg_start] = start
+        walk[seg_start:seg_start + reset_every] = np.cumsum(step_arr[seg_start:seg_start + reset_every])
     return walk
 
 
@@ -1,6 +1,11 @@
 import numpy as np
 from ._version import __version__
 
+try:
+    import numexpr as ne
+except ImportError:
+    ne = None
+
 __all__ = ["flux_to_mag", "flux_err_to_mag_err", "print_version", "elk_say"]
 
 
@@ -23,6 +28,12 @@ _elk_say_base = r"""     /|        |\
         \ oo /
          \__/"""
 
+# magnitude zero point: 2.5 * log10(f1) + m1 for calibration flux f1 = 15000 at calibration mag m1 = 10
+_MAG_ZERO_POINT = 2.5 * np.log10(15000) + 10
+
+# |d_mag/d_flux| prefactor for converting flux errors to magnitude errors
+_MAG_ERR_COEFF = 2.5 / np.log(10)
+
 """ ANSI color codes """
 RED = "\033[0;31m"
 GREEN = "\033[0;32m"
@@ -43,10 +54,12 @@ def flux_to_mag(flux):
     mag : :class:`~numpy.ndarray` or `float`
         TESS Magnitude centered in the I band
     """
-    m1 = 10     # calibration mag
-    f1 = 15000  # Calibration Flux corresponding to the calibration mag
-    mag = 2.5 * np.log10(f1 / flux) + m1
-    return mag
+    # expand 2.5 * log10(f1 / flux) + m1 so that the constant part is hoisted into the zero point and the
+    # flux array only needs a single log10 pass
+    if ne is not None:
+        return ne.evaluate("zero_point - 2.5 * log10(flux)",
+                           local_dict={'flux': flux, 'zero_point': _MAG_ZERO_POINT})
+    return _MAG_ZERO_POINT - 2.5 * np.log10(flux)
 
 
 def flux_err_to_mag_err(flux, flux_err):
@@ -64,9 +77,11 @@ def flux_err_to_mag_err(flux, flux_err):
    mag_err : class: `~numpy.ndarray` or `float`
         TESS Magnittude errors
     """
-    d_mag_d_flux = -2.5 / (flux * np.log(10))
-    m_err_squared = abs(d_mag_d_flux)**2 * flux_err**2
-    return np.sqrt(m_err_squared)
+    # |d_mag/d_flux| * flux_err in one fused pass - no need for the sqrt(x**2) roundtrip
+    if ne is not None:
+        return ne.evaluate("abs(2.5 * flux_err / (flux * log(10.0)))",
+                           local_dict={'flux': flux, 'flux_err': flux_err})
+    return np.abs(_MAG_ERR_COEFF * flux_err / flux)
 
 def print_warning(*args):
     """Print a warning in yellow, prefixed by WARNING"""